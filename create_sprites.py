@@ -1,95 +1,201 @@
+# Generates the sprites in assets/sprites. Needs Pillow; Pillow-SIMD is a
+# drop-in replacement and is picked up without code changes.
+import hashlib
+import io
+import json
+from pathlib import Path
+
 from PIL import Image, ImageDraw
 
-def create_sprite(name, size, draw_func):
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
+SPRITES_DIR = Path('assets/sprites')
+
+# Pixel hash plus the size and mtime of each PNG as last written, so unchanged
+# sprites aren't re-encoded but replaced or reverted files are
+CACHE_PATH = SPRITES_DIR / '.cache.json'
+
+def load_cache():
+    try:
+        with open(CACHE_PATH) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def save_cache(cache):
+    with open(CACHE_PATH, 'w') as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+
+# Almost every sprite is 16x16, so they all share one canvas and its
+# ImageDraw, cleared between sprites instead of allocating new ones
+SCRATCH = Image.new('RGBA', (16, 16), (0, 0, 0, 0))
+SCRATCH_DRAW = ImageDraw.Draw(SCRATCH)
+
+def cache_entry(path, pixel_hash):
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return {'hash': pixel_hash, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+def create_sprite(name, size, draw_func, cached_entry=None):
+    if size == 16:
+        img, draw = SCRATCH, SCRATCH_DRAW
+        img.paste((0, 0, 0, 0), (0, 0, 16, 16))
+    else:
+        img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(img)
     draw_func(draw)
-    img.save(f'assets/sprites/{name}.png')
-
-# Player sprite (simple 8-bit character)
-def draw_player(draw):
+    return save_sprite(name, img, cached_entry)
+
+# Built sprites return a finished image instead of drawing onto a blank one
+def create_built_sprite(name, size, build_func, cached_entry=None):
+    img = build_func()
+    if img.size != (size, size):
+        raise ValueError(f'{name}: built a {img.width}x{img.height} image, expected {size}x{size}')
+    return save_sprite(name, img, cached_entry)
+
+def save_sprite(name, img, cached_entry=None):
+    path = SPRITES_DIR / f'{name}.png'
+    # Skip the PNG encode if the pixels match what was last written and the
+    # file on disk is still the one that was written
+    pixel_hash = hashlib.blake2b(img.tobytes(), digest_size=16).hexdigest()
+    entry = cache_entry(path, pixel_hash)
+    if entry is None or entry != cached_entry:
+        # Deflate effort buys nothing on 1 KiB images, so use the fastest level.
+        # Encoding into memory first lets the whole file go out in one write
+        buf = io.BytesIO()
+        img.save(buf, format='PNG', compress_level=1)
+        path.write_bytes(buf.getbuffer())
+        entry = cache_entry(path, pixel_hash)
+    return entry
+
+# ImageDraw.rectangle re-resolves its fill color on every call, so solid
+# fills go straight to the core drawer with the ink cached per color
+inks = {}
+
+def fill_rect(draw, xy, color):
+    key = (draw.mode, color)
+    ink = inks.get(key)
+    if ink is None:
+        ink = inks[key] = draw.draw.draw_ink(color)
+    draw.draw.draw_rectangle(xy, ink, 1)
+
+# Simple 8-bit character, recolored per creature
+def make_humanoid(body, head, legs):
+    def draw_variant(draw):
+        # Body
+        fill_rect(draw, [4, 4, 11, 11], body)
+        # Head
+        fill_rect(draw, [5, 1, 10, 4], head)
+        # Arms
+        fill_rect(draw, [2, 5, 4, 9], body)
+        fill_rect(draw, [11, 5, 13, 9], body)
+        # Legs
+        fill_rect(draw, [4, 11, 6, 14], legs)
+        fill_rect(draw, [9, 11, 11, 14], legs)
+    return draw_variant
+
+# Sword with a recolorable blade and guard
+def make_sword(blade, guard):
+    def draw_variant(draw):
+        # Blade
+        draw.polygon([(8, 2), (10, 2), (10, 12), (8, 12)], fill=blade)
+        # Handle
+        fill_rect(draw, [7, 12, 11, 14], (139, 69, 19))
+        # Guard
+        fill_rect(draw, [6, 11, 12, 12], guard)
+    return draw_variant
+
+# Shrimp, tail on the left
+def make_shrimp(color):
+    def draw_variant(draw):
+        # Body
+        draw.ellipse([6, 6, 12, 10], fill=color)
+        # Tail
+        draw.polygon([(4, 8), (6, 6), (6, 10)], fill=color)
+    return draw_variant
+
+# Trout body and tail, tail on the right
+def draw_trout_body(draw, color):
     # Body
-    draw.rectangle([4, 4, 11, 11], fill=(200, 150, 100))
-    # Head
-    draw.rectangle([5, 1, 10, 4], fill=(255, 200, 150))
-    # Arms
-    draw.rectangle([2, 5, 4, 9], fill=(200, 150, 100))
-    draw.rectangle([11, 5, 13, 9], fill=(200, 150, 100))
-    # Legs
-    draw.rectangle([4, 11, 6, 14], fill=(50, 50, 150))
-    draw.rectangle([9, 11, 11, 14], fill=(50, 50, 150))
+    draw.ellipse([4, 6, 12, 10], fill=color)
+    # Tail
+    draw.polygon([(12, 8), (14, 6), (14, 10)], fill=color)
+
+def make_trout(body, eye):
+    def draw_variant(draw):
+        draw_trout_body(draw, body)
+        # Eye
+        draw.ellipse([5, 7, 6, 8], fill=eye)
+        draw.point([5, 7], fill=(0, 0, 0))
+    return draw_variant
+
+# Player sprite
+draw_player = make_humanoid(body=(200, 150, 100), head=(255, 200, 150), legs=(50, 50, 150))
 
 # Tree sprite
 def draw_tree(draw):
     # Trunk
-    draw.rectangle([6, 8, 10, 15], fill=(139, 69, 19))
+    fill_rect(draw, [6, 8, 10, 15], (139, 69, 19))
     # Leaves
-    draw.rectangle([4, 2, 12, 8], fill=(34, 139, 34))
-    draw.rectangle([2, 4, 14, 6], fill=(34, 139, 34))
+    fill_rect(draw, [4, 2, 12, 8], (34, 139, 34))
+    fill_rect(draw, [2, 4, 14, 6], (34, 139, 34))
 
 # Tree stump sprite
 def draw_tree_stump(draw):
     # Stump
-    draw.rectangle([6, 8, 10, 12], fill=(139, 69, 19))
+    fill_rect(draw, [6, 8, 10, 12], (139, 69, 19))
     # Top
     draw.ellipse([5, 6, 11, 8], fill=(160, 82, 45))
 
 # Wall sprite
 def draw_wall(draw):
     # Stone texture
+    fill_rect(draw, [0, 0, 15, 15], (120, 120, 120))
     for i in range(0, 16, 4):
         for j in range(0, 16, 4):
-            draw.rectangle([i, j, i+3, j+3], fill=(120, 120, 120))
-            draw.rectangle([i+1, j+1, i+2, j+2], fill=(100, 100, 100))
+            fill_rect(draw, [i+1, j+1, i+2, j+2], (100, 100, 100))
 
 # Goblin sprite
-def draw_goblin(draw):
-    # Body
-    draw.rectangle([4, 4, 11, 11], fill=(50, 150, 50))
-    # Head
-    draw.rectangle([5, 1, 10, 4], fill=(100, 200, 100))
-    # Arms
-    draw.rectangle([2, 5, 4, 9], fill=(50, 150, 50))
-    draw.rectangle([11, 5, 13, 9], fill=(50, 150, 50))
-    # Legs
-    draw.rectangle([4, 11, 6, 14], fill=(50, 150, 50))
-    draw.rectangle([9, 11, 11, 14], fill=(50, 150, 50))
+draw_goblin = make_humanoid(body=(50, 150, 50), head=(100, 200, 100), legs=(50, 150, 50))
 
 # Fire sprite
 def draw_fire(draw):
     # Base
-    draw.rectangle([4, 12, 12, 15], fill=(50, 50, 50))
+    fill_rect(draw, [4, 12, 12, 15], (50, 50, 50))
     # Flames
     draw.polygon([(6, 4), (10, 4), (12, 8), (8, 6), (4, 8)], fill=(255, 100, 0))
     draw.polygon([(7, 2), (9, 2), (11, 6), (8, 4), (5, 6)], fill=(255, 200, 0))
 
 # Fishing spot sprite
-def draw_fishing_spot(draw):
+# The overlapping ripples are drawn once at import and copied per render
+def render_fishing_spot():
+    img = Image.new('RGBA', (16, 16), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
     # Water ripples
     draw.ellipse([2, 2, 14, 14], fill=(0, 100, 255, 128))
     draw.ellipse([4, 4, 12, 12], fill=(0, 150, 255, 128))
     draw.ellipse([6, 6, 10, 10], fill=(100, 200, 255, 128))
+    return img
+
+FISHING_SPOT = render_fishing_spot()
+
+def build_fishing_spot():
+    return FISHING_SPOT.copy()
 
 # Sword sprite
-def draw_sword(draw):
-    # Blade
-    draw.polygon([(8, 2), (10, 2), (10, 12), (8, 12)], fill=(200, 200, 200))
-    # Handle
-    draw.rectangle([7, 12, 11, 14], fill=(139, 69, 19))
-    # Guard
-    draw.rectangle([6, 11, 12, 12], fill=(255, 215, 0))
+draw_sword = make_sword(blade=(200, 200, 200), guard=(255, 215, 0))
 
 # Axe sprite
 def draw_axe(draw):
     # Handle
-    draw.rectangle([7, 4, 9, 14], fill=(139, 69, 19))
+    fill_rect(draw, [7, 4, 9, 14], (139, 69, 19))
     # Head
     draw.polygon([(4, 2), (12, 2), (12, 6), (4, 6)], fill=(200, 200, 200))
 
 # Logs sprite
 def draw_logs(draw):
     # Log
-    draw.rectangle([4, 6, 12, 10], fill=(139, 69, 19))
+    fill_rect(draw, [4, 6, 12, 10], (139, 69, 19))
     # End grain
     draw.ellipse([3, 5, 13, 11], fill=(160, 82, 45))
     draw.ellipse([11, 5, 13, 11], fill=(160, 82, 45))
@@ -102,120 +208,163 @@ def draw_fish(draw):
     draw.polygon([(2, 8), (4, 6), (4, 10)], fill=(100, 100, 255))
 
 # Water sprite
-def draw_water(draw):
+# One row of wave arcs as a mask, rasterized once and stamped at each row offset
+def render_wave_row():
+    mask = Image.new('L', (21, 5), 0)
+    draw = ImageDraw.Draw(mask)
+    for i in range(0, 16, 4):
+        draw.arc([i, 0, i+8, 4], 0, 180, fill=255, width=1)
+    return mask
+
+WAVE_ROW = render_wave_row()
+
+def build_water():
     # Base water color
-    draw.rectangle([0, 0, 15, 15], fill=(0, 100, 255, 200))
+    img = Image.new('RGBA', (16, 16), (0, 100, 255, 200))
     # Wave details
-    for i in range(0, 16, 4):
-        draw.arc([i, 2, i+8, 6], 0, 180, fill=(100, 200, 255, 128), width=1)
-        draw.arc([i-2, 6, i+6, 10], 0, 180, fill=(100, 200, 255, 128), width=1)
-        draw.arc([i+2, 10, i+10, 14], 0, 180, fill=(100, 200, 255, 128), width=1)
+    for offset in [(0, 2), (-2, 6), (2, 10)]:
+        img.paste((100, 200, 255, 128), offset, WAVE_ROW)
+    return img
 
 # Road sprite
+ROAD_DARK = [(i+1, j+1) for i in range(0, 16, 4) for j in range(0, 16, 4)]
+ROAD_LIGHT = [(i+2, j+2) for i in range(0, 16, 4) for j in range(0, 16, 4)]
+
 def draw_road(draw):
     # Base path
-    draw.rectangle([0, 0, 15, 15], fill=(150, 140, 130))
+    fill_rect(draw, [0, 0, 15, 15], (150, 140, 130))
     # Gravel details
-    for i in range(0, 16, 4):
-        for j in range(0, 16, 4):
-            draw.point([i+1, j+1], fill=(130, 120, 110))
-            draw.point([i+2, j+2], fill=(170, 160, 150))
+    draw.point(ROAD_DARK, fill=(130, 120, 110))
+    draw.point(ROAD_LIGHT, fill=(170, 160, 150))
 
 # Fence sprite
 def draw_fence(draw):
     # Vertical posts
-    draw.rectangle([2, 4, 4, 12], fill=(139, 69, 19))
-    draw.rectangle([12, 4, 14, 12], fill=(139, 69, 19))
+    fill_rect(draw, [2, 4, 4, 12], (139, 69, 19))
+    fill_rect(draw, [12, 4, 14, 12], (139, 69, 19))
     # Horizontal boards
-    draw.rectangle([2, 6, 14, 8], fill=(160, 82, 45))
-    draw.rectangle([2, 10, 14, 12], fill=(160, 82, 45))
+    fill_rect(draw, [2, 6, 14, 8], (160, 82, 45))
+    fill_rect(draw, [2, 10, 14, 12], (160, 82, 45))
 
 # Castle wall sprite
 def draw_castle_wall(draw):
     # Main wall
-    draw.rectangle([0, 4, 15, 15], fill=(180, 180, 180))
+    fill_rect(draw, [0, 4, 15, 15], (180, 180, 180))
     # Crenellations
     for i in range(0, 16, 4):
-        draw.rectangle([i, 0, i+2, 4], fill=(180, 180, 180))
+        fill_rect(draw, [i, 0, i+2, 4], (180, 180, 180))
     # Stone details
     for i in range(0, 16, 4):
         for j in range(4, 16, 4):
-            draw.rectangle([i+1, j+1, i+3, j+3], fill=(150, 150, 150))
+            fill_rect(draw, [i+1, j+1, i+3, j+3], (150, 150, 150))
 
 # Castle door sprite
 def draw_castle_door(draw):
     # Door frame
-    draw.rectangle([2, 0, 13, 15], fill=(139, 69, 19))
+    fill_rect(draw, [2, 0, 13, 15], (139, 69, 19))
     # Door arch
     draw.arc([2, -6, 13, 4], 0, 180, fill=(160, 82, 45), width=2)
     # Door details
-    draw.rectangle([4, 2, 11, 14], fill=(120, 60, 15))
+    fill_rect(draw, [4, 2, 11, 14], (120, 60, 15))
     draw.ellipse([9, 7, 10, 8], fill=(255, 215, 0))  # Door handle
 
 # Castle stairs sprite
 def draw_castle_stairs(draw):
     # Steps
     for i in range(4):
-        draw.rectangle([0, 12-i*3, 15-i*4, 15-i*3], fill=(180, 180, 180))
-        draw.rectangle([1, 13-i*3, 14-i*4, 14-i*3], fill=(150, 150, 150))
+        fill_rect(draw, [0, 12-i*3, 15-i*4, 15-i*3], (180, 180, 180))
+        fill_rect(draw, [1, 13-i*3, 14-i*4, 14-i*3], (150, 150, 150))
 
 # Bridge sprite
 def draw_bridge(draw):
     # Main planks
-    draw.rectangle([0, 6, 15, 10], fill=(139, 69, 19))
+    fill_rect(draw, [0, 6, 15, 10], (139, 69, 19))
     # Side rails
-    draw.rectangle([0, 4, 15, 6], fill=(160, 82, 45))
-    draw.rectangle([0, 10, 15, 12], fill=(160, 82, 45))
+    fill_rect(draw, [0, 4, 15, 6], (160, 82, 45))
+    fill_rect(draw, [0, 10, 15, 12], (160, 82, 45))
     # Support posts
-    draw.rectangle([2, 2, 4, 14], fill=(120, 60, 15))
-    draw.rectangle([12, 2, 14, 14], fill=(120, 60, 15))
+    fill_rect(draw, [2, 2, 4, 14], (120, 60, 15))
+    fill_rect(draw, [12, 2, 14, 14], (120, 60, 15))
 
 # Path sprite
+PATH_DOTS = [(i, j) for i in range(0, 16, 2) for j in range(0, 16, 2)]
+PATH_DARK = [(i, j) for i, j in PATH_DOTS if (i + j) % 4 == 0]
+PATH_LIGHT = [(i, j) for i, j in PATH_DOTS if (i + j) % 4 != 0]
+
 def draw_path(draw):
     # Base dirt color
-    draw.rectangle([0, 0, 15, 15], fill=(170, 140, 100))
+    fill_rect(draw, [0, 0, 15, 15], (170, 140, 100))
     # Path details
-    for i in range(0, 16, 2):
-        for j in range(0, 16, 2):
-            if (i + j) % 4 == 0:
-                draw.point([i, j], fill=(150, 120, 80))
-            else:
-                draw.point([i, j], fill=(190, 160, 120))
-
-# Bronze helmet sprite
-def draw_bronze_helmet(draw):
+    draw.point(PATH_DARK, fill=(150, 120, 80))
+    draw.point(PATH_LIGHT, fill=(190, 160, 120))
+
+# Templates are drawn once as 'L' mode masks of region indices (0 stays
+# transparent) and colored through an RGBA palette, colors[0] filling region 1
+def render_template(draw_template):
+    mask = Image.new('L', (16, 16), 0)
+    draw_template(ImageDraw.Draw(mask))
+    return mask
+
+def make_recolored(template, colors):
+    palette = [0, 0, 0, 0]
+    for color in colors:
+        palette += [*color, 255]
+    indexed = template.copy()
+    indexed.putpalette(palette, 'RGBA')
+    img = indexed.convert('RGBA')
+    def build_recolored():
+        return img.copy()
+    return build_recolored
+
+# Armor pieces share a template per slot and are recolored per metal
+PLATE = 1
+TRIM = 2
+
+BRONZE = ((205, 127, 50), (184, 115, 51))
+
+# Helmet template
+def draw_helmet_template(draw):
     # Main helmet shape
-    draw.rectangle([4, 4, 12, 12], fill=(205, 127, 50))  # Bronze color
+    fill_rect(draw, [4, 4, 12, 12], PLATE)
     # Helmet top
-    draw.arc([4, 2, 12, 10], 0, 180, fill=(205, 127, 50), width=2)
+    draw.arc([4, 2, 12, 10], 0, 180, fill=PLATE, width=2)
     # Helmet details
-    draw.line([4, 8, 12, 8], fill=(184, 115, 51), width=1)
+    draw.line([4, 8, 12, 8], fill=TRIM, width=1)
 
-# Bronze platebody sprite
-def draw_bronze_platebody(draw):
+# Platebody template
+def draw_platebody_template(draw):
     # Main body
-    draw.rectangle([4, 2, 12, 12], fill=(205, 127, 50))
+    fill_rect(draw, [4, 2, 12, 12], PLATE)
     # Shoulder pads
-    draw.rectangle([2, 2, 4, 6], fill=(205, 127, 50))
-    draw.rectangle([12, 2, 14, 6], fill=(205, 127, 50))
+    fill_rect(draw, [2, 2, 4, 6], PLATE)
+    fill_rect(draw, [12, 2, 14, 6], PLATE)
     # Armor details
-    draw.line([6, 4, 10, 4], fill=(184, 115, 51), width=1)
-    draw.line([6, 8, 10, 8], fill=(184, 115, 51), width=1)
+    draw.line([6, 4, 10, 4], fill=TRIM, width=1)
+    draw.line([6, 8, 10, 8], fill=TRIM, width=1)
 
-# Bronze platelegs sprite
-def draw_bronze_platelegs(draw):
+# Platelegs template
+def draw_platelegs_template(draw):
     # Legs
-    draw.rectangle([4, 2, 7, 14], fill=(205, 127, 50))
-    draw.rectangle([9, 2, 12, 14], fill=(205, 127, 50))
+    fill_rect(draw, [4, 2, 7, 14], PLATE)
+    fill_rect(draw, [9, 2, 12, 14], PLATE)
     # Belt area
-    draw.rectangle([4, 2, 12, 4], fill=(184, 115, 51))
+    fill_rect(draw, [4, 2, 12, 4], TRIM)
+
+HELMET = render_template(draw_helmet_template)
+PLATEBODY = render_template(draw_platebody_template)
+PLATELEGS = render_template(draw_platelegs_template)
+
+# Bronze armor sprites
+build_bronze_helmet = make_recolored(HELMET, BRONZE)
+build_bronze_platebody = make_recolored(PLATEBODY, BRONZE)
+build_bronze_platelegs = make_recolored(PLATELEGS, BRONZE)
 
 # Fishing rod sprite
 def draw_fishing_rod(draw):
     # Rod
     draw.line([4, 2, 12, 8], fill=(139, 69, 19), width=2)
     # Handle
-    draw.rectangle([2, 12, 6, 14], fill=(139, 69, 19))
+    fill_rect(draw, [2, 12, 6, 14], (139, 69, 19))
     # Line
     draw.line([12, 8, 14, 12], fill=(200, 200, 200), width=1)
 
@@ -228,79 +377,51 @@ def draw_bait(draw):
 # Tinderbox sprite
 def draw_tinderbox(draw):
     # Box
-    draw.rectangle([4, 6, 12, 12], fill=(139, 69, 19))
+    fill_rect(draw, [4, 6, 12, 12], (139, 69, 19))
     # Flint and steel
     draw.line([6, 4, 10, 4], fill=(150, 150, 150), width=2)
     # Box details
-    draw.rectangle([5, 7, 11, 11], fill=(101, 67, 33))
+    fill_rect(draw, [5, 7, 11, 11], (101, 67, 33))
 
 # Raw shrimp sprite
-def draw_raw_shrimp(draw):
-    # Body
-    draw.ellipse([6, 6, 12, 10], fill=(255, 150, 150))
-    # Tail
-    draw.polygon([(4, 8), (6, 6), (6, 10)], fill=(255, 150, 150))
+draw_raw_shrimp = make_shrimp((255, 150, 150))
 
 # Cooked shrimp sprite
-def draw_cooked_shrimp(draw):
-    # Body
-    draw.ellipse([6, 6, 12, 10], fill=(255, 120, 90))
-    # Tail
-    draw.polygon([(4, 8), (6, 6), (6, 10)], fill=(255, 120, 90))
+draw_cooked_shrimp = make_shrimp((255, 120, 90))
 
 # Raw trout sprite
-def draw_raw_trout(draw):
-    # Body
-    draw.ellipse([4, 6, 12, 10], fill=(150, 150, 255))
-    # Tail
-    draw.polygon([(12, 8), (14, 6), (14, 10)], fill=(150, 150, 255))
-    # Eye
-    draw.ellipse([5, 7, 6, 8], fill=(255, 255, 255))
-    draw.point([5, 7], fill=(0, 0, 0))
+draw_raw_trout = make_trout(body=(150, 150, 255), eye=(255, 255, 255))
 
 # Cooked trout sprite
-def draw_cooked_trout(draw):
-    # Body
-    draw.ellipse([4, 6, 12, 10], fill=(180, 140, 100))
-    # Tail
-    draw.polygon([(12, 8), (14, 6), (14, 10)], fill=(180, 140, 100))
-    # Eye
-    draw.ellipse([5, 7, 6, 8], fill=(200, 200, 200))
-    draw.point([5, 7], fill=(0, 0, 0))
+draw_cooked_trout = make_trout(body=(180, 140, 100), eye=(200, 200, 200))
 
 # Burnt fish sprite
 def draw_burnt_fish(draw):
-    # Body
-    draw.ellipse([4, 6, 12, 10], fill=(50, 50, 50))
-    # Tail
-    draw.polygon([(12, 8), (14, 6), (14, 10)], fill=(50, 50, 50))
+    draw_trout_body(draw, (50, 50, 50))
     # Charred details
     draw.line([6, 7, 10, 7], fill=(30, 30, 30), width=1)
     draw.line([6, 9, 10, 9], fill=(30, 30, 30), width=1)
 
 # Bronze sword sprite
-def draw_bronze_sword(draw):
-    # Blade
-    draw.polygon([(8, 2), (10, 2), (10, 12), (8, 12)], fill=(205, 127, 50))  # Bronze color
-    # Handle
-    draw.rectangle([7, 12, 11, 14], fill=(139, 69, 19))
-    # Guard
-    draw.rectangle([6, 11, 12, 12], fill=(205, 127, 50))
+draw_bronze_sword = make_sword(blade=(205, 127, 50), guard=(205, 127, 50))
 
 # Bank chest sprite
 def draw_bank_chest(draw):
     # Main chest body
-    draw.rectangle([2, 4, 13, 13], fill=(139, 69, 19))  # Dark wood color
+    fill_rect(draw, [2, 4, 13, 13], (139, 69, 19))  # Dark wood color
     # Chest lid
-    draw.rectangle([2, 2, 13, 4], fill=(160, 82, 45))   # Lighter wood color
+    fill_rect(draw, [2, 2, 13, 4], (160, 82, 45))   # Lighter wood color
     # Metal bands
-    draw.rectangle([2, 6, 13, 7], fill=(192, 192, 192))  # Silver color
-    draw.rectangle([2, 10, 13, 11], fill=(192, 192, 192))
+    fill_rect(draw, [2, 6, 13, 7], (192, 192, 192))  # Silver color
+    fill_rect(draw, [2, 10, 13, 11], (192, 192, 192))
     # Lock
-    draw.rectangle([6, 6, 9, 9], fill=(255, 215, 0))     # Gold color
+    fill_rect(draw, [6, 6, 9, 9], (255, 215, 0))     # Gold color
 
 # GP (Gold coins) sprite
-def draw_gp(draw):
+# The overlapping coin stack is drawn once at import and copied per render
+def render_gp():
+    img = Image.new('RGBA', (16, 16), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
     # Main coin
     draw.ellipse([4, 4, 12, 12], fill=(255, 215, 0))  # Gold color
     # Coin details
@@ -308,11 +429,17 @@ def draw_gp(draw):
     # Stack effect (additional coins)
     draw.ellipse([3, 6, 11, 14], fill=(255, 215, 0), outline=(218, 165, 32))
     draw.ellipse([2, 8, 10, 16], fill=(255, 215, 0), outline=(218, 165, 32))
+    return img
+
+GP_SPRITE = render_gp()
+
+def build_gp():
+    return GP_SPRITE.copy()
 
 # Raw beef sprite
 def draw_raw_beef(draw):
     # Draw the main meat shape
-    draw.rectangle([4, 4, 12, 12], fill=(200, 100, 100))  # Raw meat color
+    fill_rect(draw, [4, 4, 12, 12], (200, 100, 100))  # Raw meat color
     # Add some texture/marbling
     draw.line([5, 6, 11, 6], fill=(255, 200, 200))  # Light pink marbling
     draw.line([6, 8, 10, 8], fill=(255, 200, 200))  # More marbling
@@ -321,7 +448,7 @@ def draw_raw_beef(draw):
 # Cooked beef sprite
 def draw_cooked_beef(draw):
     # Draw the main meat shape
-    draw.rectangle([4, 4, 12, 12], fill=(139, 69, 19))  # Brown color for cooked meat
+    fill_rect(draw, [4, 4, 12, 12], (139, 69, 19))  # Brown color for cooked meat
     # Add grill marks
     draw.line([5, 6, 11, 6], fill=(90, 45, 12))  # Dark brown grill marks
     draw.line([5, 9, 11, 9], fill=(90, 45, 12))  # More grill marks
@@ -329,12 +456,22 @@ def draw_cooked_beef(draw):
 # Burnt beef sprite
 def draw_burnt_beef(draw):
     # Draw the main meat shape
-    draw.rectangle([4, 4, 12, 12], fill=(50, 25, 0))  # Very dark brown/black
+    fill_rect(draw, [4, 4, 12, 12], (50, 25, 0))  # Very dark brown/black
     # Add burnt texture
     draw.line([5, 6, 11, 6], fill=(30, 15, 0))  # Almost black lines
     draw.line([5, 9, 11, 9], fill=(30, 15, 0))  # More burnt lines
 
-# List of all sprites to create
+# Sprites built directly as finished images
+built_sprites = [
+    ('fishing_spot', 16, build_fishing_spot),
+    ('water', 16, build_water),
+    ('bronze_helmet', 16, build_bronze_helmet),
+    ('bronze_platebody', 16, build_bronze_platebody),
+    ('bronze_platelegs', 16, build_bronze_platelegs),
+    ('gp', 16, build_gp),
+]
+
+# Sprites drawn onto a blank canvas
 sprites = [
     ('player', 16, draw_player),
     ('tree', 16, draw_tree),
@@ -342,12 +479,10 @@ sprites = [
     ('wall', 16, draw_wall),
     ('goblin', 16, draw_goblin),
     ('fire', 16, draw_fire),
-    ('fishing_spot', 16, draw_fishing_spot),
     ('sword', 16, draw_sword),
     ('axe', 16, draw_axe),
     ('logs', 16, draw_logs),
     ('fish', 16, draw_fish),
-    ('water', 16, draw_water),
     ('road', 16, draw_road),
     ('fence', 16, draw_fence),
     ('castle_wall', 16, draw_castle_wall),
@@ -355,9 +490,6 @@ sprites = [
     ('castle_stairs', 16, draw_castle_stairs),
     ('bridge', 16, draw_bridge),
     ('path', 16, draw_path),
-    ('bronze_helmet', 16, draw_bronze_helmet),
-    ('bronze_platebody', 16, draw_bronze_platebody),
-    ('bronze_platelegs', 16, draw_bronze_platelegs),
     ('bronze_sword', 16, draw_bronze_sword),
     ('bronze_axe', 16, draw_axe),
     ('fishing_rod', 16, draw_fishing_rod),
@@ -369,51 +501,19 @@ sprites = [
     ('cooked_trout', 16, draw_cooked_trout),
     ('burnt_fish', 16, draw_burnt_fish),
     ('bank_chest', 16, draw_bank_chest),
-    ('gp', 16, draw_gp),
     ('raw_beef', 16, draw_raw_beef),
     ('cooked_beef', 16, draw_cooked_beef),
     ('burnt_beef', 16, draw_burnt_beef),
 ]
 
-# Create all sprites
-for name, size, draw_func in sprites:
-    create_sprite(name, size, draw_func)
-
 if __name__ == "__main__":
     # Create sprites directory if it doesn't exist
-    import os
-    os.makedirs('assets/sprites', exist_ok=True)
+    SPRITES_DIR.mkdir(parents=True, exist_ok=True)
 
     # Create all sprites
-    create_sprite('player', 16, draw_player)
-    create_sprite('tree', 16, draw_tree)
-    create_sprite('tree_stump', 16, draw_tree_stump)
-    create_sprite('wall', 16, draw_wall)
-    create_sprite('goblin', 16, draw_goblin)
-    create_sprite('fire', 16, draw_fire)
-    create_sprite('fishing_spot', 16, draw_fishing_spot)
-    create_sprite('sword', 16, draw_sword)
-    create_sprite('axe', 16, draw_axe)
-    create_sprite('logs', 16, draw_logs)
-    create_sprite('fish', 16, draw_fish)
-    create_sprite('water', 16, draw_water)
-    create_sprite('road', 16, draw_road)
-    create_sprite('fence', 16, draw_fence)
-    create_sprite('castle_wall', 16, draw_castle_wall)
-    create_sprite('castle_door', 16, draw_castle_door)
-    create_sprite('castle_stairs', 16, draw_castle_stairs)
-    create_sprite('bridge', 16, draw_bridge)
-    create_sprite('path', 16, draw_path)
-    create_sprite('bronze_helmet', 16, draw_bronze_helmet)
-    create_sprite('bronze_platebody', 16, draw_bronze_platebody)
-    create_sprite('bronze_platelegs', 16, draw_bronze_platelegs)
-    create_sprite('fishing_rod', 16, draw_fishing_rod)
-    create_sprite('bait', 16, draw_bait)
-    create_sprite('tinderbox', 16, draw_tinderbox)
-    create_sprite('raw_shrimp', 16, draw_raw_shrimp)
-    create_sprite('cooked_shrimp', 16, draw_cooked_shrimp)
-    create_sprite('bank_chest', 16, draw_bank_chest)
-    create_sprite('gp', 16, draw_gp)
-    create_sprite('raw_beef', 16, draw_raw_beef)
-    create_sprite('cooked_beef', 16, draw_cooked_beef)
-    create_sprite('burnt_beef', 16, draw_burnt_beef)
\ No newline at end of file
+    cache = load_cache()
+    for name, size, draw_func in sprites:
+        cache[name] = create_sprite(name, size, draw_func, cache.get(name))
+    for name, size, build_func in built_sprites:
+        cache[name] = create_built_sprite(name, size, build_func, cache.get(name))
+    save_cache(cache)